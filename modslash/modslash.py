@@ -1,142 +1,98 @@
 import discord
+from contextlib import asynccontextmanager
 from redbot.core import commands, app_commands, Config
 from redbot.core.bot import Red
-from typing import List
-
-# This check function is defined outside the class.
-# It verifies if the user invoking the command is either the bot owner
-# or has one of the roles configured in the cog's settings.
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+# Responses mention members and roles for readability only; nobody should be pinged by them.
+_NO_MENTIONS = discord.AllowedMentions.none()
+
+# Response templates shared by the slash and context menu commands.
+MSG_NO_MOD_ROLES = "No moderator roles have been configured on this server."
+MSG_MISSING_MOD_ROLE = "You do not have the required role to use this command."
+MSG_CANNOT_SELF = "You cannot {action} yourself."
+MSG_AUTHOR_HIERARCHY = "You cannot {action} a member with an equal or higher role."
+MSG_BOT_HIERARCHY = "I cannot {action} a member with an equal or higher role than me."
+MSG_NOT_IN_VC = "{mention} is not in a voice channel."
+MSG_NO_PERMS = "I don't have the required permissions to {action} this user."
+MSG_ERROR = "An error occurred: {error}"
+
+def _format_reason(action: str, author: discord.abc.User, reason_suffix: str = "") -> str:
+    """Builds the audit log reason for a moderation action from a preformatted reason suffix."""
+    return f"{action} by {author.name} ({author.id}).{reason_suffix}"
+
+class ModAction(NamedTuple):
+    """Describes one moderation action run by ModSlash._do_action."""
+    verb: str
+    past: str
+    need_voice: bool
+    need_bot_hierarchy: bool
+    permissions: discord.Permissions
+    apply: Callable[[discord.Member, str], Awaitable[None]]
+
+# Every slash and context menu command is a thin wrapper that looks its action up here.
+_ACTIONS: Dict[str, ModAction] = {
+    "kick": ModAction("kick", "kicked", False, True, discord.Permissions(kick_members=True), lambda m, r: m.kick(reason=r)),
+    "ban": ModAction("ban", "banned", False, True, discord.Permissions(ban_members=True), lambda m, r: m.ban(reason=r)),
+    "mute": ModAction("mute", "muted", True, False, discord.Permissions(mute_members=True), lambda m, r: m.edit(mute=True, reason=r)),
+    "unmute": ModAction("unmute", "unmuted", True, False, discord.Permissions(mute_members=True), lambda m, r: m.edit(mute=False, reason=r)),
+    "deafen": ModAction("deafen", "deafened", True, False, discord.Permissions(deafen_members=True), lambda m, r: m.edit(deafen=True, reason=r)),
+    "undeafen": ModAction("undeafen", "undeafened", True, False, discord.Permissions(deafen_members=True), lambda m, r: m.edit(deafen=False, reason=r)),
+    "silence": ModAction("silence", "silenced", True, False, discord.Permissions(mute_members=True, deafen_members=True), lambda m, r: m.edit(mute=True, deafen=True, reason=r)),
+    "unsilence": ModAction("unsilence", "unsilenced", True, False, discord.Permissions(mute_members=True, deafen_members=True), lambda m, r: m.edit(mute=False, deafen=False, reason=r)),
+}
+
+# The loaded ModSlash instance, so the context menus can reach it without a get_cog lookup.
+_COG_REF: Optional["ModSlash"] = None
+
+# This check function is defined outside the class for the context menu commands,
+# which aren't bound to the cog. Slash commands go through ModSlash.interaction_check.
 async def is_mod_check(interaction: discord.Interaction) -> bool:
     """Checks if the user has a configured moderator role or is the bot owner."""
-    if await interaction.client.is_owner(interaction.user):
-        return True
-    
-    cog = interaction.client.get_cog("ModSlash")
+    cog = _COG_REF
     if not cog:
+        # The context menus need the cog to run, so nobody passes while it isn't loaded.
         return False
-
-    mod_role_ids = await cog.config.guild(interaction.guild).mod_roles()
-    if not mod_role_ids:
-        await interaction.response.send_message("No moderator roles have been configured on this server.", ephemeral=True)
-        return False
-
-    author_role_ids = {role.id for role in interaction.user.roles}
-    
-    if not author_role_ids.intersection(mod_role_ids):
-        await interaction.response.send_message("You do not have the required role to use this command.", ephemeral=True)
-        return False
-
-    return True
+    return await cog._is_mod_check(interaction)
 
 # --- Context Menu Command Definitions (MUST be outside the class) ---
+# These are thin wrappers; the checks and the API call live in ModSlash._do_action.
+
+async def _context_menu_action(interaction: discord.Interaction, member: discord.Member, name: str):
+    """Runs a moderation action for a context menu command through the loaded cog."""
+    cog = _COG_REF
+    audit_reason = f"{_ACTIONS[name].past.capitalize()} by {interaction.user.display_name} via context menu."
+    await cog._do_action(interaction, member, name, audit_reason=audit_reason)
 
 @app_commands.context_menu(name="Kick User")
 @app_commands.default_permissions(kick_members=True)
 @app_commands.check(is_mod_check)
 async def kick_context_menu(interaction: discord.Interaction, member: discord.Member):
     """Kicks a user via the right-click context menu."""
-    author = interaction.user
-    bot = interaction.client
-    reason = f"Kicked by {author.display_name} via context menu."
-
-    if member.id == author.id:
-        await interaction.response.send_message("You cannot kick yourself.", ephemeral=True)
-        return
-
-    if author.top_role <= member.top_role and not await bot.is_owner(author):
-        await interaction.response.send_message("You cannot kick a member with an equal or higher role.", ephemeral=True)
-        return
-
-    if interaction.guild.me.top_role <= member.top_role:
-        await interaction.response.send_message("I cannot kick a member with an equal or higher role than me.", ephemeral=True)
-        return
-
-    try:
-        await member.kick(reason=reason)
-        await interaction.response.send_message(f"Successfully kicked {member.mention}.", ephemeral=True)
-    except discord.Forbidden:
-        await interaction.response.send_message("I don't have the required permissions to kick this user.", ephemeral=True)
-    except Exception as e:
-        await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+    await _context_menu_action(interaction, member, "kick")
 
 @app_commands.context_menu(name="Ban User")
 @app_commands.default_permissions(ban_members=True)
 @app_commands.check(is_mod_check)
 async def ban_context_menu(interaction: discord.Interaction, member: discord.Member):
     """Bans a user via the right-click context menu."""
-    author = interaction.user
-    bot = interaction.client
-    reason = f"Banned by {author.display_name} via context menu."
-
-    if member.id == author.id:
-        await interaction.response.send_message("You cannot ban yourself.", ephemeral=True)
-        return
-
-    if author.top_role <= member.top_role and not await bot.is_owner(author):
-        await interaction.response.send_message("You cannot ban a member with an equal or higher role.", ephemeral=True)
-        return
-
-    if interaction.guild.me.top_role <= member.top_role:
-        await interaction.response.send_message("I cannot ban a member with an equal or higher role than me.", ephemeral=True)
-        return
-
-    try:
-        await member.ban(reason=reason)
-        await interaction.response.send_message(f"Successfully banned {member.mention}.", ephemeral=True)
-    except discord.Forbidden:
-        await interaction.response.send_message("I don't have the required permissions to ban this user.", ephemeral=True)
-    except Exception as e:
-        await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+    await _context_menu_action(interaction, member, "ban")
 
 @app_commands.context_menu(name="Mute User")
 @app_commands.default_permissions(mute_members=True)
 @app_commands.check(is_mod_check)
 async def mute_context_menu(interaction: discord.Interaction, member: discord.Member):
     """Mutes a user via the right-click context menu."""
-    author = interaction.user
-    bot = interaction.client
-    reason = f"Muted by {author.display_name} via context menu."
-
-    if not member.voice or not member.voice.channel:
-        await interaction.response.send_message(f"{member.mention} is not in a voice channel.", ephemeral=True)
-        return
-
-    if author.top_role <= member.top_role and not await bot.is_owner(author):
-        await interaction.response.send_message("You cannot mute a member with an equal or higher role.", ephemeral=True)
-        return
-
-    try:
-        await member.edit(mute=True, reason=reason)
-        await interaction.response.send_message(f"Successfully muted {member.mention}.", ephemeral=True)
-    except discord.Forbidden:
-        await interaction.response.send_message("I don't have the required permissions to mute this user.", ephemeral=True)
-    except Exception as e:
-        await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+    await _context_menu_action(interaction, member, "mute")
 
 @app_commands.context_menu(name="Deafen User")
 @app_commands.default_permissions(deafen_members=True)
 @app_commands.check(is_mod_check)
 async def deafen_context_menu(interaction: discord.Interaction, member: discord.Member):
     """Deafens a user via the right-click context menu."""
-    author = interaction.user
-    bot = interaction.client
-    reason = f"Deafened by {author.display_name} via context menu."
-
-    if not member.voice or not member.voice.channel:
-        await interaction.response.send_message(f"{member.mention} is not in a voice channel.", ephemeral=True)
-        return
-
-    if author.top_role <= member.top_role and not await bot.is_owner(author):
-        await interaction.response.send_message("You cannot deafen a member with an equal or higher role.", ephemeral=True)
-        return
+    await _context_menu_action(interaction, member, "deafen")
 
-    try:
-        await member.edit(deafen=True, reason=reason)
-        await interaction.response.send_message(f"Successfully deafened {member.mention}.", ephemeral=True)
-    except discord.Forbidden:
-        await interaction.response.send_message("I don't have the required permissions to deafen this user.", ephemeral=True)
-    except Exception as e:
-        await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+_CONTEXT_MENUS = (kick_context_menu, ban_context_menu, mute_context_menu, deafen_context_menu)
 
 
 class ModSlash(commands.Cog):
@@ -150,18 +106,120 @@ class ModSlash(commands.Cog):
         self.config = Config.get_conf(self, identifier=5842647, force_registration=True)
         default_guild = {"mod_roles": []}
         self.config.register_guild(**default_guild)
+        # In-memory copy of each guild's mod_roles so the permission check doesn't hit Config.
+        self._mod_role_cache: Dict[int, FrozenSet[int]] = {}
+        # The same roles in the order they were added, which is how they're stored and listed.
+        self._mod_role_order: Dict[int, Tuple[int, ...]] = {}
+        # The bot's top role per guild, dropped whenever the bot's roles or the guild's role order change.
+        self._bot_top_roles: Dict[int, discord.Role] = {}
         
-        self.bot.tree.add_command(kick_context_menu)
-        self.bot.tree.add_command(ban_context_menu)
-        self.bot.tree.add_command(mute_context_menu)
-        self.bot.tree.add_command(deafen_context_menu)
+        global _COG_REF
+        _COG_REF = self
+        for menu in _CONTEXT_MENUS:
+            self.bot.tree.add_command(menu)
+
+    async def cog_load(self):
+        """Warms the moderator role cache for every guild in a single Config read."""
+        all_guilds = await self.config.all_guilds()
+        for guild_id, data in all_guilds.items():
+            self._cache_mod_roles(guild_id, data.get("mod_roles", ()))
 
     async def cog_unload(self):
         """Clean up when the cog is unloaded."""
-        self.bot.tree.remove_command(kick_context_menu.name, type=discord.AppCommandType.user)
-        self.bot.tree.remove_command(ban_context_menu.name, type=discord.AppCommandType.user)
-        self.bot.tree.remove_command(mute_context_menu.name, type=discord.AppCommandType.user)
-        self.bot.tree.remove_command(deafen_context_menu.name, type=discord.AppCommandType.user)
+        global _COG_REF
+        if _COG_REF is self:
+            _COG_REF = None
+        for menu in _CONTEXT_MENUS:
+            self.bot.tree.remove_command(menu.name, type=discord.AppCommandType.user)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Applies the moderator check to every slash command in this cog."""
+        return await self._is_mod_check(interaction)
+
+    async def _is_mod_check(self, interaction: discord.Interaction) -> bool:
+        """Checks if the user has a configured moderator role or is the bot owner."""
+        user = interaction.user
+        if self._is_owner_sync(user.id):
+            return True
+
+        guild_id = interaction.guild_id
+        mod_role_ids = self._mod_role_cache.get(guild_id)
+        if mod_role_ids is None:
+            mod_role_ids = await self._get_mod_roles(guild_id)
+        if not mod_role_ids:
+            await interaction.response.send_message(MSG_NO_MOD_ROLES, ephemeral=True)
+            return False
+
+        # Member.get_role bisects the member's sorted role ID array, whereas user.roles builds and sorts Role objects.
+        # That array never holds @everyone (whose ID is the guild ID), so it is matched separately.
+        if guild_id not in mod_role_ids and not any(user.get_role(role_id) is not None for role_id in mod_role_ids):
+            await interaction.response.send_message(MSG_MISSING_MOD_ROLE, ephemeral=True)
+            return False
+
+        return True
+
+    async def _get_mod_roles(self, guild_id: int) -> FrozenSet[int]:
+        """Returns the cached moderator role IDs for a guild, loading them from Config on a miss."""
+        mod_roles = self._mod_role_cache.get(guild_id)
+        if mod_roles is None:
+            loaded = await self.config.guild_from_id(guild_id).mod_roles()
+            # Another writer may have filled the cache while Config was being read; theirs is newer.
+            mod_roles = self._mod_role_cache.get(guild_id)
+            if mod_roles is None:
+                mod_roles = self._cache_mod_roles(guild_id, loaded)
+        return mod_roles
+
+    def _cache_mod_roles(self, guild_id: int, role_ids: Iterable[int]) -> FrozenSet[int]:
+        """Caches a guild's moderator roles, keeping their order and dropping duplicates."""
+        order = tuple(dict.fromkeys(role_ids))
+        mod_roles = self._mod_role_cache[guild_id] = frozenset(order)
+        self._mod_role_order[guild_id] = order
+        return mod_roles
+
+    async def _set_mod_roles(self, guild: discord.Guild, role_ids: Iterable[int]):
+        """
+        Replaces a guild's moderator roles, updating the cache before persisting to Config.
+        Callers build `role_ids` from the cache with no await in between, so overlapping writers
+        always start from the latest value instead of a stale snapshot.
+        """
+        self._cache_mod_roles(guild.id, role_ids)
+        await self.config.guild(guild).mod_roles.set(list(self._mod_role_order[guild.id]))
+
+    def _get_bot_top_role(self, guild: discord.Guild) -> discord.Role:
+        """Returns the bot's cached top role in a guild, resolving it from guild.me on a miss."""
+        top_role = self._bot_top_roles.get(guild.id)
+        # discord.py rebuilds a guild's roles after an outage or a re-IDENTIFY, orphaning the cached Role
+        # without any event; a Role still attached to the current Guild object is the live one.
+        if top_role is None or top_role.guild is not guild:
+            top_role = self._bot_top_roles[guild.id] = guild.me.top_role
+        return top_role
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        """Forgets the bot's cached top role when the bot's own roles change."""
+        if after.id == self.bot.user.id:
+            self._bot_top_roles.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Forgets the bot's cached top role when a role is moved, since another of its roles may now be on top."""
+        if before.position != after.position:
+            self._bot_top_roles.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Drops the bot's cached top role for a guild it has left."""
+        self._bot_top_roles.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Prunes deleted roles from the stored and cached moderator roles."""
+        self._bot_top_roles.pop(role.guild.id, None)
+        mod_roles = await self._get_mod_roles(role.guild.id)
+        if role.id not in mod_roles:
+            return
+
+        await self._set_mod_roles(role.guild, [r for r in self._mod_role_order[role.guild.id] if r != role.id])
 
     # --- Configuration Commands (Now as Prefix Commands) ---
     @commands.group()
@@ -174,217 +232,161 @@ class ModSlash(commands.Cog):
     @modslashset.command(name="addrole")
     async def add_mod_role(self, ctx: commands.Context, role: discord.Role):
         """Adds a role that can use ModSlash commands."""
-        async with self.config.guild(ctx.guild).mod_roles() as mod_roles:
-            if role.id in mod_roles:
-                await ctx.send(f"{role.mention} is already a moderator role.")
-            else:
-                mod_roles.append(role.id)
-                await ctx.send(f"{role.mention} has been added as a moderator role.")
+        mod_roles = await self._get_mod_roles(ctx.guild.id)
+        if role.id in mod_roles:
+            await ctx.send(f"{role.mention} is already a moderator role.", allowed_mentions=_NO_MENTIONS)
+            return
+
+        await self._set_mod_roles(ctx.guild, (*self._mod_role_order[ctx.guild.id], role.id))
+        await ctx.send(f"{role.mention} has been added as a moderator role.", allowed_mentions=_NO_MENTIONS)
 
     @modslashset.command(name="removerole")
     async def remove_mod_role(self, ctx: commands.Context, role: discord.Role):
         """Removes a role from the ModSlash moderators."""
-        async with self.config.guild(ctx.guild).mod_roles() as mod_roles:
-            if role.id not in mod_roles:
-                await ctx.send(f"{role.mention} is not a moderator role.")
-            else:
-                mod_roles.remove(role.id)
-                await ctx.send(f"{role.mention} has been removed from the moderator roles.")
+        mod_roles = await self._get_mod_roles(ctx.guild.id)
+        if role.id not in mod_roles:
+            await ctx.send(f"{role.mention} is not a moderator role.", allowed_mentions=_NO_MENTIONS)
+            return
+
+        await self._set_mod_roles(ctx.guild, [r for r in self._mod_role_order[ctx.guild.id] if r != role.id])
+        await ctx.send(f"{role.mention} has been removed from the moderator roles.", allowed_mentions=_NO_MENTIONS)
 
     @modslashset.command(name="listroles")
     async def list_mod_roles(self, ctx: commands.Context):
         """Lists the roles that can use ModSlash commands."""
-        mod_role_ids = await self.config.guild(ctx.guild).mod_roles()
-        if not mod_role_ids:
+        if not await self._get_mod_roles(ctx.guild.id):
             await ctx.send("No moderator roles are configured.")
             return
 
-        role_mentions = [f"<@&{role_id}>" for role_id in mod_role_ids]
-        await ctx.send(f"Moderator roles: {', '.join(role_mentions)}", allowed_mentions=discord.AllowedMentions.none())
+        role_mentions = ", ".join(map("<@&{}>".format, self._mod_role_order[ctx.guild.id]))
+        await ctx.send(f"Moderator roles: {role_mentions}", allowed_mentions=_NO_MENTIONS)
 
 
     # --- Helper Functions ---
-    async def _check_voice_channel(self, interaction: discord.Interaction, member: discord.Member) -> bool:
-        if not member.voice or not member.voice.channel:
-            await interaction.response.send_message(f"{member.mention} is not in a voice channel.", ephemeral=True)
-            return False
-        return True
+    def _is_owner_sync(self, user_id: int) -> bool:
+        """Checks bot ownership against Red's owner ID set without awaiting is_owner."""
+        return user_id in self.bot.owner_ids
+
+    def _validate(self, interaction: discord.Interaction, member: discord.Member, action: ModAction) -> Optional[str]:
+        """Runs the voice, self-target, role hierarchy and bot permission checks, returning an error message if any fail."""
+        voice_channel = None
+        if action.need_voice:
+            voice = member.voice
+            if voice is None or voice.channel is None:
+                return MSG_NOT_IN_VC.format(mention=member.mention)
+            voice_channel = voice.channel
 
-    # --- Slash Commands ---
-    @app_commands.command(name="kick", description="Kicks a user from the server.")
-    @app_commands.default_permissions(kick_members=True)
-    @app_commands.describe(member="The user to kick.", reason="The reason for the kick.")
-    @app_commands.check(is_mod_check)
-    async def kick_slash(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
         author = interaction.user
         if member.id == author.id:
-            await interaction.response.send_message("You cannot kick yourself.", ephemeral=True)
+            return MSG_CANNOT_SELF.format(action=action.verb)
+
+        member_top = member.top_role
+        if not self._is_owner_sync(author.id) and author.top_role <= member_top:
+            return MSG_AUTHOR_HIERARCHY.format(action=action.verb)
+
+        guild = interaction.guild
+        if action.need_bot_hierarchy and self._get_bot_top_role(guild) <= member_top:
+            return MSG_BOT_HIERARCHY.format(action=action.verb)
+
+        # Catch missing permissions from the cached permission bits instead of waiting on a 403. This must never
+        # be stricter than Discord: permissions_for() on a voice channel drops mute/deafen when the bot can't
+        # connect there, so voice actions are only refused when neither the guild nor the channel grants them.
+        me = guild.me
+        required = action.permissions
+        if not me.guild_permissions >= required and (
+            voice_channel is None or not voice_channel.permissions_for(me) >= required
+        ):
+            return MSG_NO_PERMS.format(action=action.verb)
+
+        return None
+
+    @asynccontextmanager
+    async def _discord_errors(self, interaction: discord.Interaction, action: str):
+        """Reports a failed moderation API call to the invoking user via followup."""
+        try:
+            yield
+        except discord.Forbidden:
+            await interaction.followup.send(MSG_NO_PERMS.format(action=action), ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(MSG_ERROR.format(error=e), ephemeral=True)
+
+    async def _do_action(
+        self,
+        interaction: discord.Interaction,
+        member: discord.Member,
+        name: str,
+        reason: Optional[str] = None,
+        *,
+        audit_reason: Optional[str] = None,
+    ):
+        """
+        Runs the checks for a moderation action and applies it to the member.
+        `audit_reason` overrides the audit log entry that is otherwise built from `reason`.
+        """
+        action = _ACTIONS[name]
+        err = self._validate(interaction, member, action)
+        if err:
+            await interaction.response.send_message(err, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
 
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot kick a member with an equal or higher role.", ephemeral=True)
-            return
+        # The reason suffix is shared by the reply and the audit log entry so it's only formatted once.
+        past = action.past
+        reason_suffix = "" if reason is None else f" Reason: {reason}"
+        success_msg = f"Successfully {past} {member.mention}.{reason_suffix}"
+        if audit_reason is None:
+            audit_reason = _format_reason(past.capitalize(), interaction.user, reason_suffix)
 
-        if interaction.guild.me.top_role <= member.top_role:
-            await interaction.response.send_message("I cannot kick a member with an equal or higher role than me.", ephemeral=True)
-            return
+        # Acknowledge first so a slow or rate-limited API call can't outlive the 3 second interaction window.
+        await interaction.response.defer(ephemeral=True)
+        async with self._discord_errors(interaction, action.verb):
+            await action.apply(member, audit_reason)
+            await interaction.followup.send(success_msg, ephemeral=True, allowed_mentions=_NO_MENTIONS)
 
-        try:
-            await member.kick(reason=f"Kicked by {author.name} ({author.id}). Reason: {reason}")
-            await interaction.response.send_message(f"Successfully kicked {member.mention}. Reason: {reason}", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to kick this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+    # --- Slash Commands ---
+    @app_commands.command(name="kick", description="Kicks a user from the server.")
+    @app_commands.default_permissions(kick_members=True)
+    @app_commands.describe(member="The user to kick.", reason="The reason for the kick.")
+    async def kick_slash(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
+        await self._do_action(interaction, member, "kick", reason)
 
     @app_commands.command(name="ban", description="Bans a user from the server.")
     @app_commands.default_permissions(ban_members=True)
     @app_commands.describe(member="The user to ban.", reason="The reason for the ban.")
-    @app_commands.check(is_mod_check)
     async def ban_slash(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
-        author = interaction.user
-        if member.id == author.id:
-            await interaction.response.send_message("You cannot ban yourself.", ephemeral=True)
-            return
-
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot ban a member with an equal or higher role.", ephemeral=True)
-            return
-
-        if interaction.guild.me.top_role <= member.top_role:
-            await interaction.response.send_message("I cannot ban a member with an equal or higher role than me.", ephemeral=True)
-            return
-
-        try:
-            await member.ban(reason=f"Banned by {author.name} ({author.id}). Reason: {reason}")
-            await interaction.response.send_message(f"Successfully banned {member.mention}. Reason: {reason}", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to ban this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+        await self._do_action(interaction, member, "ban", reason)
 
     @app_commands.command(name="mute", description="Mutes a user in their voice channel.")
     @app_commands.default_permissions(mute_members=True)
     @app_commands.describe(member="The user to mute.", reason="The reason for the mute.")
-    @app_commands.check(is_mod_check)
     async def mute_slash(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
-        if not await self._check_voice_channel(interaction, member):
-            return
-
-        author = interaction.user
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot mute a member with an equal or higher role.", ephemeral=True)
-            return
-
-        try:
-            await member.edit(mute=True, reason=f"Muted by {author.name} ({author.id}). Reason: {reason}")
-            await interaction.response.send_message(f"Successfully muted {member.mention}. Reason: {reason}", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to mute this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+        await self._do_action(interaction, member, "mute", reason)
 
     @app_commands.command(name="unmute", description="Unmutes a user in their voice channel.")
     @app_commands.default_permissions(mute_members=True)
     @app_commands.describe(member="The user to unmute.")
-    @app_commands.check(is_mod_check)
     async def unmute_slash(self, interaction: discord.Interaction, member: discord.Member):
-        if not await self._check_voice_channel(interaction, member):
-            return
-
-        author = interaction.user
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot unmute a member with an equal or higher role.", ephemeral=True)
-            return
-
-        try:
-            await member.edit(mute=False, reason=f"Unmuted by {author.name} ({author.id}).")
-            await interaction.response.send_message(f"Successfully unmuted {member.mention}.", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to unmute this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+        await self._do_action(interaction, member, "unmute")
 
     @app_commands.command(name="deafen", description="Deafens a user in their voice channel.")
     @app_commands.default_permissions(deafen_members=True)
     @app_commands.describe(member="The user to deafen.", reason="The reason for the deafen.")
-    @app_commands.check(is_mod_check)
     async def deafen_slash(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
-        if not await self._check_voice_channel(interaction, member):
-            return
-
-        author = interaction.user
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot deafen a member with an equal or higher role.", ephemeral=True)
-            return
-
-        try:
-            await member.edit(deafen=True, reason=f"Deafened by {author.name} ({author.id}). Reason: {reason}")
-            await interaction.response.send_message(f"Successfully deafened {member.mention}. Reason: {reason}", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to deafen this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+        await self._do_action(interaction, member, "deafen", reason)
 
     @app_commands.command(name="undeafen", description="Undeafens a user in their voice channel.")
     @app_commands.default_permissions(deafen_members=True)
     @app_commands.describe(member="The user to undeafen.")
-    @app_commands.check(is_mod_check)
     async def undeafen_slash(self, interaction: discord.Interaction, member: discord.Member):
-        if not await self._check_voice_channel(interaction, member):
-            return
-            
-        author = interaction.user
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot undeafen a member with an equal or higher role.", ephemeral=True)
-            return
-
-        try:
-            await member.edit(deafen=False, reason=f"Undeafened by {author.name} ({author.id}).")
-            await interaction.response.send_message(f"Successfully undeafened {member.mention}.", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to undeafen this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+        await self._do_action(interaction, member, "undeafen")
 
     @app_commands.command(name="silence", description="Mutes and deafens a user in their voice channel.")
     @app_commands.default_permissions(mute_members=True, deafen_members=True)
     @app_commands.describe(member="The user to silence.", reason="The reason for the silence.")
-    @app_commands.check(is_mod_check)
     async def silence_slash(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
-        if not await self._check_voice_channel(interaction, member):
-            return
-
-        author = interaction.user
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot silence a member with an equal or higher role.", ephemeral=True)
-            return
-
-        try:
-            await member.edit(mute=True, deafen=True, reason=f"Silenced by {author.name} ({author.id}). Reason: {reason}")
-            await interaction.response.send_message(f"Successfully silenced {member.mention}. Reason: {reason}", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to silence this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+        await self._do_action(interaction, member, "silence", reason)
 
     @app_commands.command(name="unsilence", description="Unmutes and undeafens a user in their voice channel.")
     @app_commands.default_permissions(mute_members=True, deafen_members=True)
     @app_commands.describe(member="The user to unsilence.")
-    @app_commands.check(is_mod_check)
     async def unsilence_slash(self, interaction: discord.Interaction, member: discord.Member):
-        if not await self._check_voice_channel(interaction, member):
-            return
-
-        author = interaction.user
-        if author.top_role <= member.top_role and not await self.bot.is_owner(author):
-            await interaction.response.send_message("You cannot unsilence a member with an equal or higher role.", ephemeral=True)
-            return
-
-        try:
-            await member.edit(mute=False, deafen=False, reason=f"Unsilenced by {author.name} ({author.id}).")
-            await interaction.response.send_message(f"Successfully unsilenced {member.mention}.", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("I don't have the required permissions to unsilence this user.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
+        await self._do_action(interaction, member, "unsilence")